@@ -0,0 +1,49 @@
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import case, select
+from sqlmodel import Session, col, func
+
+from app.models import Budget, DashboardSummary, Investment, Transaction, TransactionType, Wallet
+
+
+def _sum_for_user(column: Any, user_column: Any, user_id: int, *criteria: Any) -> Any:
+    """Scalar subquery summing a column for one user, 0 when there are no rows."""
+    return select(func.coalesce(func.sum(column), 0)).where(user_column == user_id, *criteria).scalar_subquery()
+
+
+def get_dashboard_summary(session: Session, user_id: int) -> DashboardSummary:
+    """Compute the dashboard totals for a user in a single aggregate query."""
+    income = func.coalesce(
+        func.sum(case((col(Transaction.type) == TransactionType.INCOME, col(Transaction.amount)), else_=0)), 0
+    )
+    expenses = func.coalesce(
+        func.sum(case((col(Transaction.type) == TransactionType.EXPENSE, col(Transaction.amount)), else_=0)), 0
+    )
+    stmt = select(
+        income.label("income"),
+        expenses.label("expenses"),
+        _sum_for_user(col(Budget.allocated_amount), col(Budget.user_id), user_id, col(Budget.is_active)).label(
+            "total_budget"
+        ),
+        _sum_for_user(col(Budget.remaining_amount), col(Budget.user_id), user_id, col(Budget.is_active)).label(
+            "budget_remaining"
+        ),
+        _sum_for_user(col(Investment.current_value), col(Investment.user_id), user_id, col(Investment.is_active)).label(
+            "total_investments"
+        ),
+        _sum_for_user(col(Wallet.balance), col(Wallet.user_id), user_id).label("wallet_balance"),
+    ).where(col(Transaction.user_id) == user_id)
+
+    row = session.execute(stmt).one()
+    total_income = Decimal(row.income)
+    total_expenses = Decimal(row.expenses)
+    return DashboardSummary(
+        total_income=total_income,
+        total_expenses=total_expenses,
+        net_income=total_income - total_expenses,
+        total_budget=Decimal(row.total_budget),
+        budget_remaining=Decimal(row.budget_remaining),
+        total_investments=Decimal(row.total_investments),
+        wallet_balance=Decimal(row.wallet_balance),
+    )
@@ -1,8 +1,35 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+from sqlmodel import (
+    SQLModel,
+    Field,
+    Relationship,
+    CheckConstraint,
+    Column,
+    Computed,
+    DateTime,
+    Index,
+    Numeric,
+    func,
+    text,
+)
+from sqlalchemy import FetchedValue
+from sqlalchemy.dialects.postgresql import JSONB
+from pydantic import ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from decimal import Decimal
 from enum import Enum
+import re
+
+
+# Email format checked by the user schemas at the API boundary; compiled once at import
+EMAIL_REGEX = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+
+
+def _check_email(value: str) -> str:
+    if EMAIL_PATTERN.fullmatch(value) is None:
+        raise ValueError("Invalid email address")
+    return value
 
 
 # Enums for type safety
@@ -31,25 +58,45 @@ class InvestmentType(str, Enum):
     OTHER = "other"
 
 
+class InvestmentTransactionType(str, Enum):
+    BUY = "buy"
+    SELL = "sell"
+    DIVIDEND = "dividend"
+    FEE = "fee"
+    SPLIT = "split"
+
+
+def _timestamp_column(onupdate: bool = False, primary_key: bool = False) -> Column:
+    """Timestamp stamped by the database on insert (and by the set_updated_at trigger on update when requested)."""
+    return Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue() if onupdate else None,
+        primary_key=primary_key,
+        nullable=False,
+    )
+
+
 # Persistent models (stored in database)
 class User(SQLModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(unique=True, max_length=50)
-    email: str = Field(unique=True, max_length=255, regex=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    email: str = Field(unique=True, max_length=255)
     full_name: str = Field(max_length=100)
     password_hash: str = Field(max_length=255)
     role: UserRole = Field(default=UserRole.USER)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
+    # Transaction history is unbounded, so it stays lazy; load it per query with selectinload() when needed
     transactions: List["Transaction"] = Relationship(back_populates="user")
-    budgets: List["Budget"] = Relationship(back_populates="user")
-    investments: List["Investment"] = Relationship(back_populates="user")
-    wallets: List["Wallet"] = Relationship(back_populates="user")
+    budgets: List["Budget"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    investments: List["Investment"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
+    wallets: List["Wallet"] = Relationship(back_populates="user", sa_relationship_kwargs={"lazy": "selectin"})
 
 
 class Category(SQLModel, table=True):
@@ -62,7 +109,7 @@ class Category(SQLModel, table=True):
     color: Optional[str] = Field(default=None, max_length=7)  # Hex color code
     icon: Optional[str] = Field(default=None, max_length=50)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
     created_by: Optional[int] = Field(default=None, foreign_key="users.id")
 
     # Relationships
@@ -72,14 +119,15 @@ class Category(SQLModel, table=True):
 
 class Wallet(SQLModel, table=True):
     __tablename__ = "wallets"  # type: ignore[assignment]
+    __table_args__ = (Index("ux_wallet_primary", "user_id", unique=True, postgresql_where=text("is_primary")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=100)
-    balance: Decimal = Field(default=Decimal("0"), decimal_places=2)
+    balance: Decimal = Field(default=Decimal("0"), max_digits=14, decimal_places=2)
     is_primary: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
     user: User = Relationship(back_populates="wallets")
@@ -88,19 +136,26 @@ class Wallet(SQLModel, table=True):
 
 class Budget(SQLModel, table=True):
     __tablename__ = "budgets"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_budget_user_month_year", "user_id", "year", "month"),
+        CheckConstraint("month BETWEEN 1 AND 12", name="ck_budget_month"),
+        CheckConstraint("year >= 2000", name="ck_budget_year"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     category_id: int = Field(foreign_key="categories.id")
     name: str = Field(max_length=100)
-    allocated_amount: Decimal = Field(decimal_places=2)
-    spent_amount: Decimal = Field(default=Decimal("0"), decimal_places=2)
-    remaining_amount: Decimal = Field(default=Decimal("0"), decimal_places=2)
+    allocated_amount: Decimal = Field(max_digits=14, decimal_places=2)
+    spent_amount: Decimal = Field(default=Decimal("0"), max_digits=14, decimal_places=2)
+    remaining_amount: Optional[Decimal] = Field(
+        default=None, sa_column=Column(Numeric(14, 2), Computed("allocated_amount - spent_amount", persisted=True))
+    )
     month: int = Field(ge=1, le=12)
     year: int = Field(ge=2000)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
     user: User = Relationship(back_populates="budgets")
@@ -109,18 +164,26 @@ class Budget(SQLModel, table=True):
 
 class Transaction(SQLModel, table=True):
     __tablename__ = "transactions"  # type: ignore[assignment]
-
-    id: Optional[int] = Field(default=None, primary_key=True)
+    __table_args__ = (
+        Index("ix_tx_user_date", "user_id", "transaction_date"),
+        Index("ix_tx_cat_type", "category_id", "type"),
+        Index("ix_tx_wallet", "wallet_id"),
+        Index("brin_tx_date", "transaction_date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        # Monthly partitions are created by app.database; the primary key must include the partition key
+        {"postgresql_partition_by": "RANGE (transaction_date)"},
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
     user_id: int = Field(foreign_key="users.id")
     category_id: int = Field(foreign_key="categories.id")
     wallet_id: int = Field(foreign_key="wallets.id")
     type: TransactionType = Field()
-    amount: Decimal = Field(decimal_places=2)
+    amount: Decimal = Field(max_digits=14, decimal_places=2)
     description: str = Field(max_length=500)
     notes: Optional[str] = Field(default=None, max_length=1000)
-    transaction_date: datetime = Field(default_factory=datetime.utcnow)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    transaction_date: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(primary_key=True))
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
     user: User = Relationship(back_populates="transactions")
@@ -132,18 +195,18 @@ class Investment(SQLModel, table=True):
     __tablename__ = "investments"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id")
+    user_id: int = Field(foreign_key="users.id", index=True)
     name: str = Field(max_length=100)
     type: InvestmentType = Field()
-    initial_amount: Decimal = Field(decimal_places=2)
-    current_value: Decimal = Field(decimal_places=2)
-    monthly_contribution: Decimal = Field(default=Decimal("0"), decimal_places=2)
-    expected_return_rate: Optional[Decimal] = Field(default=None, decimal_places=4)
+    initial_amount: Decimal = Field(max_digits=14, decimal_places=2)
+    current_value: Decimal = Field(max_digits=14, decimal_places=2)
+    monthly_contribution: Decimal = Field(default=Decimal("0"), max_digits=14, decimal_places=2)
+    expected_return_rate: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
     description: Optional[str] = Field(default=None, max_length=1000)
-    start_date: datetime = Field(default_factory=datetime.utcnow)
+    start_date: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column(onupdate=True))
 
     # Relationships
     user: User = Relationship(back_populates="investments")
@@ -152,16 +215,21 @@ class Investment(SQLModel, table=True):
 
 class InvestmentTransaction(SQLModel, table=True):
     __tablename__ = "investment_transactions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_invtx_invid_date", "investment_id", "transaction_date"),
+        Index("ix_invtx_inv_type_date", "investment_id", "transaction_type", "transaction_date"),
+        Index("brin_invtx_date", "transaction_date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     investment_id: int = Field(foreign_key="investments.id")
-    transaction_type: str = Field(max_length=20)  # buy, sell, dividend, etc.
-    amount: Decimal = Field(decimal_places=2)
-    quantity: Optional[Decimal] = Field(default=None, decimal_places=4)
-    price_per_unit: Optional[Decimal] = Field(default=None, decimal_places=4)
+    transaction_type: InvestmentTransactionType = Field()
+    amount: Decimal = Field(max_digits=14, decimal_places=2)
+    quantity: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
+    price_per_unit: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
     description: str = Field(max_length=500)
-    transaction_date: datetime = Field(default_factory=datetime.utcnow)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    transaction_date: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
 
     # Relationships
     investment: Investment = Relationship(back_populates="investment_transactions")
@@ -169,40 +237,64 @@ class InvestmentTransaction(SQLModel, table=True):
 
 class Report(SQLModel, table=True):
     __tablename__ = "reports"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_reports_params_gin", "parameters", postgresql_using="gin"),
+        Index("ux_reports_cache_key", "user_id", "report_type", "cache_key", unique=True),
+        Index("brin_reports_generated_at", "generated_at", postgresql_using="brin"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
     report_type: str = Field(max_length=50)  # monthly, yearly, category, investment
     title: str = Field(max_length=200)
-    parameters: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    generated_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: Optional[datetime] = Field(default=None)
+    parameters: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    generated_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSONB))
+    generated_at: Optional[datetime] = Field(default=None, sa_column=_timestamp_column())
+    expires_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
+    cache_key: Optional[str] = Field(default=None, max_length=64)  # sha256 of parameters, for cached reports
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
 class UserCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     username: str = Field(max_length=50)
     email: str = Field(max_length=255)
     full_name: str = Field(max_length=100)
     password: str = Field(min_length=8)
     role: UserRole = Field(default=UserRole.USER)
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: str) -> str:
+        return _check_email(value)
+
 
 class UserUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     username: Optional[str] = Field(default=None, max_length=50)
     email: Optional[str] = Field(default=None, max_length=255)
     full_name: Optional[str] = Field(default=None, max_length=100)
     role: Optional[UserRole] = Field(default=None)
     is_active: Optional[bool] = Field(default=None)
 
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, value: Optional[str]) -> Optional[str]:
+        return value if value is None else _check_email(value)
+
 
 class UserLogin(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     username: str = Field(max_length=50)
     password: str = Field(min_length=1)
 
 
 class CategoryCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: str = Field(max_length=100)
     description: Optional[str] = Field(default=None, max_length=500)
     type: CategoryType = Field()
@@ -211,6 +303,8 @@ class CategoryCreate(SQLModel, table=False):
 
 
 class CategoryUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
     description: Optional[str] = Field(default=None, max_length=500)
     color: Optional[str] = Field(default=None, max_length=7)
@@ -219,81 +313,101 @@ class CategoryUpdate(SQLModel, table=False):
 
 
 class WalletCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: str = Field(max_length=100)
-    balance: Decimal = Field(default=Decimal("0"), decimal_places=2)
+    balance: Decimal = Field(default=Decimal("0"), max_digits=14, decimal_places=2)
     is_primary: bool = Field(default=False)
 
 
 class WalletUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
-    balance: Optional[Decimal] = Field(default=None, decimal_places=2)
+    balance: Optional[Decimal] = Field(default=None, max_digits=14, decimal_places=2)
     is_primary: Optional[bool] = Field(default=None)
 
 
 class BudgetCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     category_id: int = Field()
     name: str = Field(max_length=100)
-    allocated_amount: Decimal = Field(decimal_places=2)
+    allocated_amount: Decimal = Field(max_digits=14, decimal_places=2)
     month: int = Field(ge=1, le=12)
     year: int = Field(ge=2000)
 
 
 class BudgetUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
-    allocated_amount: Optional[Decimal] = Field(default=None, decimal_places=2)
+    allocated_amount: Optional[Decimal] = Field(default=None, max_digits=14, decimal_places=2)
     is_active: Optional[bool] = Field(default=None)
 
 
 class TransactionCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     category_id: int = Field()
     wallet_id: int = Field()
     type: TransactionType = Field()
-    amount: Decimal = Field(decimal_places=2)
+    amount: Decimal = Field(max_digits=14, decimal_places=2)
     description: str = Field(max_length=500)
     notes: Optional[str] = Field(default=None, max_length=1000)
     transaction_date: Optional[datetime] = Field(default=None)
 
 
 class TransactionUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     category_id: Optional[int] = Field(default=None)
     wallet_id: Optional[int] = Field(default=None)
-    amount: Optional[Decimal] = Field(default=None, decimal_places=2)
+    amount: Optional[Decimal] = Field(default=None, max_digits=14, decimal_places=2)
     description: Optional[str] = Field(default=None, max_length=500)
     notes: Optional[str] = Field(default=None, max_length=1000)
     transaction_date: Optional[datetime] = Field(default=None)
 
 
 class InvestmentCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: str = Field(max_length=100)
     type: InvestmentType = Field()
-    initial_amount: Decimal = Field(decimal_places=2)
-    current_value: Decimal = Field(decimal_places=2)
-    monthly_contribution: Decimal = Field(default=Decimal("0"), decimal_places=2)
-    expected_return_rate: Optional[Decimal] = Field(default=None, decimal_places=4)
+    initial_amount: Decimal = Field(max_digits=14, decimal_places=2)
+    current_value: Decimal = Field(max_digits=14, decimal_places=2)
+    monthly_contribution: Decimal = Field(default=Decimal("0"), max_digits=14, decimal_places=2)
+    expected_return_rate: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
     description: Optional[str] = Field(default=None, max_length=1000)
     start_date: Optional[datetime] = Field(default=None)
 
 
 class InvestmentUpdate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
-    current_value: Optional[Decimal] = Field(default=None, decimal_places=2)
-    monthly_contribution: Optional[Decimal] = Field(default=None, decimal_places=2)
-    expected_return_rate: Optional[Decimal] = Field(default=None, decimal_places=4)
+    current_value: Optional[Decimal] = Field(default=None, max_digits=14, decimal_places=2)
+    monthly_contribution: Optional[Decimal] = Field(default=None, max_digits=14, decimal_places=2)
+    expected_return_rate: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
     description: Optional[str] = Field(default=None, max_length=1000)
     is_active: Optional[bool] = Field(default=None)
 
 
 class InvestmentTransactionCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     investment_id: int = Field()
-    transaction_type: str = Field(max_length=20)
-    amount: Decimal = Field(decimal_places=2)
-    quantity: Optional[Decimal] = Field(default=None, decimal_places=4)
-    price_per_unit: Optional[Decimal] = Field(default=None, decimal_places=4)
+    transaction_type: InvestmentTransactionType = Field()
+    amount: Decimal = Field(max_digits=14, decimal_places=2)
+    quantity: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
+    price_per_unit: Optional[Decimal] = Field(default=None, max_digits=18, decimal_places=4)
     description: str = Field(max_length=500)
     transaction_date: Optional[datetime] = Field(default=None)
 
 
 class ReportCreate(SQLModel, table=False):
+    model_config = ConfigDict(extra="forbid")  # type: ignore[assignment]
+
     report_type: str = Field(max_length=50)
     title: str = Field(max_length=200)
     parameters: Dict[str, Any] = Field(default={})
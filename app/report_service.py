@@ -0,0 +1,152 @@
+import hashlib
+import json
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Tuple
+
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import Session, col, select
+
+from app.models import (
+    Category,
+    CategorySummary,
+    MonthlyTrend,
+    Report,
+    ReportCreate,
+    Transaction,
+    TransactionType,
+)
+
+DEFAULT_REPORT_TTL = timedelta(hours=1)
+REPORT_STREAM_BATCH_SIZE = 5000
+
+
+def report_cache_key(parameters: Dict[str, Any]) -> str:
+    """Deterministic key for a set of report parameters, independent of key order."""
+    payload = json.dumps(parameters, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_or_create_report(
+    session: Session,
+    user_id: int,
+    data: ReportCreate,
+    generate: Callable[[Dict[str, Any]], Dict[str, Any]],
+    ttl: timedelta = DEFAULT_REPORT_TTL,
+) -> Report:
+    """Return the stored report for these parameters while it is fresh, regenerating it once it expires.
+
+    `generate` receives the report parameters and returns the data to store; it only runs on a cache miss.
+    Stale rows are replaced in place by an upsert on (user_id, report_type, cache_key).
+    """
+    key = report_cache_key(data.parameters)
+    now = datetime.now(timezone.utc)
+
+    cached = session.exec(
+        select(Report).where(
+            col(Report.user_id) == user_id,
+            col(Report.report_type) == data.report_type,
+            col(Report.cache_key) == key,
+            col(Report.expires_at) > now,
+        )
+    ).first()
+    if cached is not None:
+        return cached
+
+    generated_data = generate(data.parameters)
+    expires_at = data.expires_at if data.expires_at is not None else now + ttl
+    values = {
+        "title": data.title,
+        "parameters": data.parameters,
+        "generated_data": generated_data,
+        "generated_at": now,
+        "expires_at": expires_at,
+    }
+    stmt = (
+        pg_insert(Report)
+        .values(user_id=user_id, report_type=data.report_type, cache_key=key, **values)
+        .on_conflict_do_update(index_elements=["user_id", "report_type", "cache_key"], set_=values)
+        .returning(Report)
+    )
+
+    try:
+        report = session.scalars(stmt, execution_options={"populate_existing": True}).one()
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    session.refresh(report)
+    return report
+
+
+def build_transaction_report(session: Session, user_id: int, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Monthly trends and per-category totals for a user, built in a single streamed pass.
+
+    Rows are fetched as plain tuples through a server-side cursor, REPORT_STREAM_BATCH_SIZE at a
+    time, so memory stays flat however long the history is. An optional integer "year" parameter
+    limits the report to that UTC calendar year; any other value raises ValueError. Months are
+    bucketed in UTC too. Suitable as the `generate` callback of get_or_create_report.
+    """
+    # SQLAlchemy's select: sqlmodel's typed overloads stop at four columns
+    stmt = (
+        sa_select(
+            col(Transaction.transaction_date),
+            col(Transaction.type),
+            col(Transaction.amount),
+            col(Transaction.category_id),
+            col(Category.name),
+            col(Category.type),
+        )
+        .join(Category, col(Category.id) == col(Transaction.category_id))
+        .where(col(Transaction.user_id) == user_id)
+    )
+    year = parameters.get("year")
+    if year is not None:
+        if not isinstance(year, int) or isinstance(year, bool):
+            raise ValueError(f"Report parameter 'year' must be an integer, got {year!r}")
+        stmt = stmt.where(
+            col(Transaction.transaction_date) >= datetime(year, 1, 1, tzinfo=timezone.utc),
+            col(Transaction.transaction_date) < datetime(year + 1, 1, 1, tzinfo=timezone.utc),
+        )
+
+    monthly: Dict[Tuple[int, int], Dict[TransactionType, Decimal]] = defaultdict(
+        lambda: {TransactionType.INCOME: Decimal("0"), TransactionType.EXPENSE: Decimal("0")}
+    )
+    categories: Dict[int, CategorySummary] = {}
+
+    for tx_date, tx_type, amount, category_id, category_name, category_type in session.execute(
+        stmt.execution_options(yield_per=REPORT_STREAM_BATCH_SIZE)
+    ):
+        # Rows come back in the connection's TimeZone; bucket in UTC to match the year bounds
+        utc_date = tx_date.astimezone(timezone.utc)
+        monthly[(utc_date.year, utc_date.month)][tx_type] += amount
+        summary = categories.get(category_id)
+        if summary is None:
+            summary = CategorySummary(
+                category_id=category_id,
+                category_name=category_name,
+                category_type=category_type,
+                total_amount=Decimal("0"),
+                transaction_count=0,
+            )
+            categories[category_id] = summary
+        summary.total_amount += amount
+        summary.transaction_count += 1
+
+    trends = [
+        MonthlyTrend(
+            year=year_,
+            month=month,
+            income=totals[TransactionType.INCOME],
+            expenses=totals[TransactionType.EXPENSE],
+            net=totals[TransactionType.INCOME] - totals[TransactionType.EXPENSE],
+        )
+        for (year_, month), totals in sorted(monthly.items())
+    ]
+    return {
+        "monthly_trends": [trend.model_dump(mode="json") for trend in trends],
+        "categories": [summary.model_dump(mode="json") for summary in categories.values()],
+    }
@@ -0,0 +1,140 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import Row, bindparam, insert, update
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, col, desc, select
+
+from app.models import Budget, Transaction, TransactionCreate, TransactionType, Wallet
+
+
+def _signed_amount(data: TransactionCreate) -> Decimal:
+    """Effect of a transaction on its wallet balance."""
+    match data.type:
+        case TransactionType.INCOME:
+            return data.amount
+        case TransactionType.EXPENSE:
+            return -data.amount
+
+
+def bulk_create_transactions(session: Session, user_id: int, rows: List[TransactionCreate]) -> int:
+    """Insert many transactions for a user and apply their balance/budget effects set-wise.
+
+    Transactions are written with a single executemany INSERT (chunked by the engine's
+    insertmanyvalues_page_size), followed by one UPDATE per affected table carrying the
+    net delta per wallet and per budget, instead of one UPDATE per transaction.
+    Raises ValueError, before writing anything, if a row names a wallet the user does not own.
+    """
+    if not rows:
+        return 0
+
+    today = datetime.now(timezone.utc)
+    tx_rows: List[Dict[str, Any]] = []
+    wallet_deltas: Dict[int, Decimal] = defaultdict(lambda: Decimal("0"))
+    budget_deltas: Dict[Tuple[int, int, int], Decimal] = defaultdict(lambda: Decimal("0"))
+
+    for data in rows:
+        # Omitted timestamps are stamped by the database's server defaults
+        tx_rows.append({**data.model_dump(exclude_none=True), "user_id": user_id})
+        wallet_deltas[data.wallet_id] += _signed_amount(data)
+        if data.type == TransactionType.EXPENSE:
+            # Budgets are monthly in UTC, matching the report buckets; naive inputs are taken as UTC
+            budget_date = data.transaction_date if data.transaction_date is not None else today
+            if budget_date.tzinfo is None:
+                budget_date = budget_date.replace(tzinfo=timezone.utc)
+            budget_date = budget_date.astimezone(timezone.utc)
+            budget_deltas[(data.category_id, budget_date.year, budget_date.month)] += data.amount
+
+    wallet_ids = set(wallet_deltas)
+    owned_wallet_ids = set(
+        session.exec(select(col(Wallet.id)).where(col(Wallet.user_id) == user_id, col(Wallet.id).in_(wallet_ids))).all()
+    )
+    foreign_wallet_ids = wallet_ids - owned_wallet_ids
+    if foreign_wallet_ids:
+        raise ValueError(f"Wallets {sorted(foreign_wallet_ids)} do not belong to user {user_id}")
+
+    # Plain connection executemany: the ORM "bulk UPDATE by primary key" mode does not allow
+    # custom WHERE criteria, so these run as Core statements within the session's transaction.
+    wallet_stmt = (
+        update(Wallet)
+        .where(col(Wallet.id) == bindparam("w_id"), col(Wallet.user_id) == user_id)
+        .values(balance=col(Wallet.balance) + bindparam("delta"))
+    )
+    budget_stmt = (
+        update(Budget)
+        .where(
+            col(Budget.user_id) == user_id,
+            col(Budget.category_id) == bindparam("b_category_id"),
+            col(Budget.year) == bindparam("b_year"),
+            col(Budget.month) == bindparam("b_month"),
+            col(Budget.is_active),
+        )
+        .values(spent_amount=col(Budget.spent_amount) + bindparam("delta"))
+    )
+
+    try:
+        session.execute(insert(Transaction), tx_rows)
+        connection = session.connection()
+        connection.execute(wallet_stmt, [{"w_id": wid, "delta": delta} for wid, delta in wallet_deltas.items()])
+        if budget_deltas:
+            connection.execute(
+                budget_stmt,
+                [
+                    {"b_category_id": category_id, "b_year": year, "b_month": month, "delta": delta}
+                    for (category_id, year, month), delta in budget_deltas.items()
+                ],
+            )
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return len(tx_rows)
+
+
+def list_transaction_rows(session: Session, user_id: int, start: datetime, end: datetime) -> Sequence[Row[Any]]:
+    """Transactions of a user in [start, end), newest first, as lightweight column rows.
+
+    Selecting columns rather than Transaction entities skips ORM object hydration and the
+    identity map for large listings. Uses SQLAlchemy's select, as sqlmodel's typed overloads stop at four columns.
+    """
+    stmt = (
+        sa_select(
+            col(Transaction.id),
+            col(Transaction.transaction_date),
+            col(Transaction.type),
+            col(Transaction.amount),
+            col(Transaction.description),
+            col(Transaction.category_id),
+            col(Transaction.wallet_id),
+        )
+        .where(
+            col(Transaction.user_id) == user_id,
+            col(Transaction.transaction_date) >= start,
+            col(Transaction.transaction_date) < end,
+        )
+        .order_by(desc(col(Transaction.transaction_date)))
+    )
+    return session.execute(stmt).all()
+
+
+def list_transactions(session: Session, user_id: int, start: datetime, end: datetime) -> List[Transaction]:
+    """Transactions of a user in [start, end), newest first, with category and wallet joined in.
+
+    Use this when rendering needs the related objects; each row's category and wallet come from
+    the same query instead of one lazy load per row.
+    """
+    stmt = (
+        select(Transaction)
+        .options(joinedload(Transaction.category), joinedload(Transaction.wallet))  # type: ignore[arg-type]
+        .where(
+            col(Transaction.user_id) == user_id,
+            col(Transaction.transaction_date) >= start,
+            col(Transaction.transaction_date) < end,
+        )
+        .order_by(desc(col(Transaction.transaction_date)))
+    )
+    return list(session.exec(stmt).all())
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from sqlmodel import Session, col, select
+
+from app.models import Wallet
+
+
+def get_primary_wallet(session: Session, user_id: int) -> Optional[Wallet]:
+    """Return the user's primary wallet, if any; served by the ux_wallet_primary partial index."""
+    return session.exec(select(Wallet).where(col(Wallet.user_id) == user_id, col(Wallet.is_primary))).first()
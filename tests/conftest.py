@@ -1,5 +1,8 @@
-from typing import Generator
+from decimal import Decimal
+from typing import Dict, Generator
 import pytest
+from app import models
+from app.database import get_session, reset_db
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +13,38 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture
+def new_db() -> Generator[None, None, None]:
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def sample_data(new_db) -> Dict[str, int]:
+    """A user with an income category, an expense category and a primary wallet holding 100."""
+    with get_session() as session:
+        app_user = models.User(
+            username="alice", email="alice@example.com", full_name="Alice Smith", password_hash="not-a-real-hash"
+        )
+        session.add(app_user)
+        session.flush()
+        assert app_user.id is not None
+
+        income = models.Category(name="Salary", type=models.CategoryType.INCOME, created_by=app_user.id)
+        expense = models.Category(name="Groceries", type=models.CategoryType.EXPENSE, created_by=app_user.id)
+        wallet = models.Wallet(user_id=app_user.id, name="Main", balance=Decimal("100"), is_primary=True)
+        session.add_all([income, expense, wallet])
+        session.flush()
+        assert income.id is not None and expense.id is not None and wallet.id is not None
+
+        ids = {
+            "user_id": app_user.id,
+            "income_category_id": income.id,
+            "expense_category_id": expense.id,
+            "wallet_id": wallet.id,
+        }
+        session.commit()
+    return ids
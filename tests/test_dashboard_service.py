@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+import pytest
+
+from app.dashboard_service import get_dashboard_summary
+from app.database import get_session
+from app.models import Budget, Investment, InvestmentType, Transaction, TransactionType
+
+
+@pytest.mark.sqlmodel
+def test_get_dashboard_summary_splits_income_and_expenses(sample_data):
+    user_id = sample_data["user_id"]
+    with get_session() as session:
+        for tx_type, category_key, amount in [
+            (TransactionType.INCOME, "income_category_id", "200"),
+            (TransactionType.EXPENSE, "expense_category_id", "50"),
+            (TransactionType.EXPENSE, "expense_category_id", "30"),
+        ]:
+            session.add(
+                Transaction(
+                    user_id=user_id,
+                    category_id=sample_data[category_key],
+                    wallet_id=sample_data["wallet_id"],
+                    type=tx_type,
+                    amount=Decimal(amount),
+                    description="test",
+                )
+            )
+        session.add(
+            Budget(
+                user_id=user_id,
+                category_id=sample_data["expense_category_id"],
+                name="Groceries",
+                allocated_amount=Decimal("300"),
+                spent_amount=Decimal("80"),
+                month=5,
+                year=2024,
+            )
+        )
+        session.add(
+            Investment(
+                user_id=user_id,
+                name="Index fund",
+                type=InvestmentType.MUTUAL_FUND,
+                initial_amount=Decimal("800"),
+                current_value=Decimal("1000"),
+            )
+        )
+        session.add(
+            Investment(
+                user_id=user_id,
+                name="Sold shares",
+                type=InvestmentType.STOCK,
+                initial_amount=Decimal("500"),
+                current_value=Decimal("500"),
+                is_active=False,
+            )
+        )
+        session.commit()
+
+        summary = get_dashboard_summary(session, user_id)
+
+    assert summary.total_income == Decimal("200")
+    assert summary.total_expenses == Decimal("80")
+    assert summary.net_income == Decimal("120")
+    assert summary.total_budget == Decimal("300")
+    assert summary.budget_remaining == Decimal("220")
+    assert summary.total_investments == Decimal("1000")
+    assert summary.wallet_balance == Decimal("100")
+
+
+@pytest.mark.sqlmodel
+def test_get_dashboard_summary_without_rows_returns_zeros(sample_data):
+    with get_session() as session:
+        summary = get_dashboard_summary(session, sample_data["user_id"])
+
+    assert summary.total_income == Decimal("0")
+    assert summary.total_expenses == Decimal("0")
+    assert summary.net_income == Decimal("0")
+    assert summary.total_budget == Decimal("0")
+    assert summary.budget_remaining == Decimal("0")
+    assert summary.total_investments == Decimal("0")
+    assert summary.wallet_balance == Decimal("100")
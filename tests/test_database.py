@@ -0,0 +1,137 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Set
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select, text
+
+from app.database import (
+    ENGINE,
+    TRANSACTION_PARTITION_MONTHS_AHEAD,
+    bulk_insert,
+    ensure_transaction_partitions,
+    get_session,
+)
+from app.models import Budget, Transaction, TransactionType, Wallet
+
+
+def _transaction_partitions() -> Set[str]:
+    with ENGINE.connect() as conn:
+        return set(
+            conn.execute(
+                text(
+                    "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'transactions'::regclass"
+                )
+            ).scalars()
+        )
+
+
+def _count(table: str) -> int:
+    with ENGINE.connect() as conn:
+        return conn.execute(text(f"SELECT count(*) FROM {table}")).scalar_one()
+
+
+@pytest.mark.sqlmodel
+def test_updated_at_is_set_by_trigger(sample_data):
+    with get_session() as session:
+        wallet = session.get(Wallet, sample_data["wallet_id"])
+        assert wallet is not None and wallet.updated_at is not None
+        before = wallet.updated_at
+
+        # The trigger overrides whatever the statement sets, so even a stale explicit value is replaced
+        session.execute(
+            update(Wallet)
+            .where(col(Wallet.id) == sample_data["wallet_id"])
+            .values(name="Renamed", updated_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
+        )
+        session.commit()
+
+        wallet = session.get(Wallet, sample_data["wallet_id"])
+        assert wallet is not None and wallet.updated_at is not None
+        assert wallet.name == "Renamed"
+        assert wallet.updated_at > before
+
+
+@pytest.mark.sqlmodel
+def test_create_tables_creates_upcoming_month_partitions(new_db):
+    partitions = _transaction_partitions()
+
+    assert "transactions_default" in partitions
+    now = datetime.now(timezone.utc)
+    index = now.year * 12 + now.month - 1
+    for offset in range(TRANSACTION_PARTITION_MONTHS_AHEAD + 1):
+        year, month = divmod(index + offset, 12)
+        assert f"transactions_y{year}m{month + 1:02d}" in partitions
+
+
+@pytest.mark.sqlmodel
+def test_ensure_transaction_partitions_moves_rows_out_of_default(sample_data):
+    backdated = datetime(2020, 6, 15, tzinfo=timezone.utc)
+    far_future = datetime(datetime.now(timezone.utc).year + 2, 3, 1, tzinfo=timezone.utc)
+    with get_session() as session:
+        for when in (backdated, far_future):
+            session.add(
+                Transaction(
+                    user_id=sample_data["user_id"],
+                    category_id=sample_data["expense_category_id"],
+                    wallet_id=sample_data["wallet_id"],
+                    type=TransactionType.EXPENSE,
+                    amount=Decimal("1"),
+                    description="outside the pre-created months",
+                    transaction_date=when,
+                )
+            )
+        session.commit()
+    assert _count("transactions_default") == 2
+
+    ensure_transaction_partitions()
+
+    assert _count("transactions_default") == 0
+    assert _count("transactions_y2020m06") == 1
+    assert _count(f"transactions_y{far_future.year}m03") == 1
+    assert _count("transactions") == 2
+    # Only months holding rows get a partition; the empty months in between are not filled in
+    partitions = _transaction_partitions()
+    assert "transactions_y2020m05" not in partitions
+    assert "transactions_y2022m01" not in partitions
+
+
+def _budget_rows(sample_data, months):
+    return [
+        {
+            "user_id": sample_data["user_id"],
+            "category_id": sample_data["expense_category_id"],
+            "name": f"Budget {month}",
+            "allocated_amount": Decimal("10"),
+            "month": month,
+            "year": 2024,
+        }
+        for month in months
+    ]
+
+
+def test_bulk_insert_rejects_non_positive_page():
+    with get_session() as session:
+        with pytest.raises(ValueError, match="page"):
+            bulk_insert(session, Budget, [], page=0)
+
+
+@pytest.mark.sqlmodel
+def test_bulk_insert_writes_all_pages(sample_data):
+    with get_session() as session:
+        assert bulk_insert(session, Budget, _budget_rows(sample_data, [1, 2, 3, 4, 5]), page=2) == 5
+
+        assert sorted(budget.month for budget in session.exec(select(Budget)).all()) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.sqlmodel
+def test_bulk_insert_rolls_back_every_page_on_failure(sample_data):
+    with get_session() as session:
+        # The last page violates ck_budget_month after two good pages have been sent
+        with pytest.raises(IntegrityError):
+            bulk_insert(session, Budget, _budget_rows(sample_data, [1, 2, 3, 4, 13]), page=2)
+
+        assert session.exec(select(Budget)).first() is None
@@ -0,0 +1,26 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.database import get_session
+from app.models import Budget
+
+
+@pytest.mark.sqlmodel
+@pytest.mark.parametrize(("month", "year"), [(13, 2024), (0, 2024), (5, 1999)])
+def test_budget_period_check_constraints(sample_data, month, year):
+    with get_session() as session:
+        # Table models skip Field(ge/le) validation on construction, so only the CHECK constraints stop these
+        session.add(
+            Budget(
+                user_id=sample_data["user_id"],
+                category_id=sample_data["expense_category_id"],
+                name="Out of range",
+                allocated_amount=Decimal("10"),
+                month=month,
+                year=year,
+            )
+        )
+        with pytest.raises(IntegrityError, match="ck_budget_"):
+            session.commit()
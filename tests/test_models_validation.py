@@ -0,0 +1,27 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models import TransactionUpdate, UserCreate, UserUpdate
+
+
+def test_request_schemas_reject_unknown_fields():
+    with pytest.raises(ValidationError, match="extra"):
+        UserCreate(
+            username="alice", email="alice@example.com", full_name="Alice Smith", password="secret-pass", admin=True
+        )
+    with pytest.raises(ValidationError, match="extra"):
+        TransactionUpdate(user_id=2)
+
+
+def test_user_schemas_reject_malformed_email():
+    with pytest.raises(ValidationError, match="Invalid email"):
+        UserCreate(username="alice", email="not-an-email", full_name="Alice Smith", password="secret-pass")
+    with pytest.raises(ValidationError, match="Invalid email"):
+        UserUpdate(email="nope")
+
+
+def test_user_schemas_accept_valid_email():
+    created = UserCreate(username="alice", email="alice@example.com", full_name="Alice Smith", password="secret-pass")
+    assert created.email == "alice@example.com"
+    assert UserUpdate(email="bob@example.org").email == "bob@example.org"
+    assert UserUpdate().email is None
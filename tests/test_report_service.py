@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+import pytest
+from sqlmodel import select, text
+
+from app.database import get_session
+from app.models import Report, ReportCreate, Transaction, TransactionType
+from app.report_service import build_transaction_report, get_or_create_report, report_cache_key
+
+
+def test_report_cache_key_ignores_parameter_order():
+    assert report_cache_key({"year": 2024, "month": 5}) == report_cache_key({"month": 5, "year": 2024})
+
+
+def test_report_cache_key_differs_per_parameters():
+    assert report_cache_key({"year": 2024}) != report_cache_key({"year": 2025})
+    assert len(report_cache_key({})) == 64
+
+
+def _counting_generator(calls: List[Dict[str, Any]]):
+    def generate(parameters: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(parameters)
+        return {"run": len(calls)}
+
+    return generate
+
+
+@pytest.mark.sqlmodel
+def test_get_or_create_report_reuses_fresh_report(sample_data):
+    calls: List[Dict[str, Any]] = []
+    data = ReportCreate(report_type="monthly", title="May", parameters={"year": 2024, "month": 5})
+
+    with get_session() as session:
+        first = get_or_create_report(session, sample_data["user_id"], data, _counting_generator(calls))
+        second = get_or_create_report(session, sample_data["user_id"], data, _counting_generator(calls))
+
+        assert len(calls) == 1
+        assert second.id == first.id
+        assert second.generated_data == {"run": 1}
+
+
+@pytest.mark.sqlmodel
+def test_get_or_create_report_regenerates_expired_report_in_place(sample_data):
+    calls: List[Dict[str, Any]] = []
+    data = ReportCreate(report_type="monthly", title="May", parameters={"year": 2024, "month": 5})
+
+    with get_session() as session:
+        stale = get_or_create_report(
+            session, sample_data["user_id"], data, _counting_generator(calls), ttl=timedelta(seconds=-1)
+        )
+        stale_id = stale.id
+        fresh = get_or_create_report(session, sample_data["user_id"], data, _counting_generator(calls))
+
+        assert len(calls) == 2
+        assert fresh.id == stale_id
+        assert fresh.generated_data == {"run": 2}
+        assert len(list(session.exec(select(Report)).all())) == 1
+
+
+def _add_tx(session, sample_data, when: str, tx_type: TransactionType, amount: str) -> None:
+    category_key = "income_category_id" if tx_type == TransactionType.INCOME else "expense_category_id"
+    session.add(
+        Transaction(
+            user_id=sample_data["user_id"],
+            category_id=sample_data[category_key],
+            wallet_id=sample_data["wallet_id"],
+            type=tx_type,
+            amount=Decimal(amount),
+            description="test",
+            transaction_date=datetime.fromisoformat(when),
+        )
+    )
+
+
+@pytest.mark.sqlmodel
+def test_build_transaction_report_buckets_months_in_utc(sample_data):
+    with get_session() as session:
+        _add_tx(session, sample_data, "2024-01-01T02:00:00+00:00", TransactionType.INCOME, "100")
+        _add_tx(session, sample_data, "2024-01-20T00:00:00+00:00", TransactionType.EXPENSE, "30")
+        _add_tx(session, sample_data, "2024-02-05T00:00:00+00:00", TransactionType.EXPENSE, "10")
+        session.commit()
+
+        # A non-UTC session would place the 2024-01-01 02:00 UTC row in December 2023
+        session.execute(text("SET LOCAL TIME ZONE 'America/New_York'"))
+        report = build_transaction_report(session, sample_data["user_id"], {})
+
+    assert report["monthly_trends"] == [
+        {"month": 1, "year": 2024, "income": "100.00", "expenses": "30.00", "net": "70.00"},
+        {"month": 2, "year": 2024, "income": "0", "expenses": "10.00", "net": "-10.00"},
+    ]
+    totals = {category["category_id"]: category for category in report["categories"]}
+    assert totals[sample_data["expense_category_id"]]["total_amount"] == "40.00"
+    assert totals[sample_data["expense_category_id"]]["transaction_count"] == 2
+
+
+@pytest.mark.sqlmodel
+def test_build_transaction_report_filters_by_year(sample_data):
+    with get_session() as session:
+        _add_tx(session, sample_data, "2023-12-31T23:00:00+00:00", TransactionType.INCOME, "5")
+        _add_tx(session, sample_data, "2024-03-01T00:00:00+00:00", TransactionType.INCOME, "7")
+        session.commit()
+
+        report = build_transaction_report(session, sample_data["user_id"], {"year": 2024})
+
+    assert [(trend["year"], trend["month"]) for trend in report["monthly_trends"]] == [(2024, 3)]
+
+
+@pytest.mark.sqlmodel
+def test_build_transaction_report_rejects_non_integer_year(sample_data):
+    with get_session() as session:
+        with pytest.raises(ValueError, match="year"):
+            build_transaction_report(session, sample_data["user_id"], {"year": "2024"})
@@ -0,0 +1,187 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from sqlmodel import col, select
+
+from app.database import get_session
+from app.models import Budget, Transaction, TransactionCreate, TransactionType, User, Wallet
+from app.transaction_service import bulk_create_transactions, list_transaction_rows, list_transactions
+
+
+@pytest.mark.sqlmodel
+def test_bulk_create_transactions_applies_wallet_and_budget_deltas(sample_data):
+    may = datetime(2024, 5, 10, tzinfo=timezone.utc)
+    rows = [
+        TransactionCreate(
+            category_id=sample_data["income_category_id"],
+            wallet_id=sample_data["wallet_id"],
+            type=TransactionType.INCOME,
+            amount=Decimal("50"),
+            description="Salary",
+            transaction_date=may,
+        ),
+        TransactionCreate(
+            category_id=sample_data["expense_category_id"],
+            wallet_id=sample_data["wallet_id"],
+            type=TransactionType.EXPENSE,
+            amount=Decimal("20"),
+            description="Market",
+            notes="weekly shop",
+            transaction_date=may,
+        ),
+        # No transaction_date: stamped by the database and booked against the current month
+        TransactionCreate(
+            category_id=sample_data["expense_category_id"],
+            wallet_id=sample_data["wallet_id"],
+            type=TransactionType.EXPENSE,
+            amount=Decimal("5"),
+            description="Coffee",
+        ),
+    ]
+
+    with get_session() as session:
+        session.add(
+            Budget(
+                user_id=sample_data["user_id"],
+                category_id=sample_data["expense_category_id"],
+                name="Groceries May",
+                allocated_amount=Decimal("500"),
+                month=5,
+                year=2024,
+            )
+        )
+        session.commit()
+
+        assert bulk_create_transactions(session, sample_data["user_id"], rows) == 3
+
+        wallet = session.get(Wallet, sample_data["wallet_id"])
+        assert wallet is not None
+        assert wallet.balance == Decimal("125")
+
+        budget = session.exec(select(Budget)).one()
+        assert budget.spent_amount == Decimal("20")
+        assert budget.remaining_amount == Decimal("480")
+
+        transactions = list(session.exec(select(Transaction)).all())
+        assert len(transactions) == 3
+        assert all(tx.created_at is not None and tx.transaction_date is not None for tx in transactions)
+        assert {tx.notes for tx in transactions} == {None, "weekly shop"}
+
+
+@pytest.mark.sqlmodel
+def test_bulk_create_transactions_rejects_foreign_wallet(sample_data):
+    with get_session() as session:
+        other = User(username="bob", email="bob@example.com", full_name="Bob Jones", password_hash="not-a-real-hash")
+        session.add(other)
+        session.flush()
+        assert other.id is not None
+        foreign_wallet = Wallet(user_id=other.id, name="Bob's", balance=Decimal("10"))
+        session.add(foreign_wallet)
+        session.commit()
+        assert foreign_wallet.id is not None
+        foreign_wallet_id = foreign_wallet.id
+
+        row = TransactionCreate(
+            category_id=sample_data["expense_category_id"],
+            wallet_id=foreign_wallet_id,
+            type=TransactionType.EXPENSE,
+            amount=Decimal("5"),
+            description="Not mine",
+        )
+        with pytest.raises(ValueError, match="do not belong"):
+            bulk_create_transactions(session, sample_data["user_id"], [row])
+        session.rollback()
+
+        unchanged = session.get(Wallet, foreign_wallet_id)
+        assert unchanged is not None
+        assert unchanged.balance == Decimal("10")
+        assert session.exec(select(col(Transaction.id))).first() is None
+
+
+@pytest.mark.sqlmodel
+def test_bulk_create_transactions_books_budgets_by_utc_month(sample_data):
+    with get_session() as session:
+        for month in (5, 6):
+            session.add(
+                Budget(
+                    user_id=sample_data["user_id"],
+                    category_id=sample_data["expense_category_id"],
+                    name=f"Groceries {month}",
+                    allocated_amount=Decimal("100"),
+                    month=month,
+                    year=2024,
+                )
+            )
+        session.commit()
+
+        # 2024-06-01 01:00 at UTC+5 is still 2024-05-31 in UTC
+        row = TransactionCreate(
+            category_id=sample_data["expense_category_id"],
+            wallet_id=sample_data["wallet_id"],
+            type=TransactionType.EXPENSE,
+            amount=Decimal("7"),
+            description="Late-night shop",
+            transaction_date=datetime.fromisoformat("2024-06-01T01:00:00+05:00"),
+        )
+        bulk_create_transactions(session, sample_data["user_id"], [row])
+
+        spent = {budget.month: budget.spent_amount for budget in session.exec(select(Budget)).all()}
+        assert spent == {5: Decimal("7"), 6: Decimal("0")}
+
+
+
+MAY_2024 = (datetime(2024, 5, 1, tzinfo=timezone.utc), datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+
+def _add_listing_transactions(session, sample_data) -> None:
+    for when, description in [
+        ("2024-04-30T23:59:00+00:00", "before start"),
+        ("2024-05-01T00:00:00+00:00", "at start"),
+        ("2024-05-20T12:00:00+00:00", "mid month"),
+        ("2024-06-01T00:00:00+00:00", "at end"),
+    ]:
+        session.add(
+            Transaction(
+                user_id=sample_data["user_id"],
+                category_id=sample_data["expense_category_id"],
+                wallet_id=sample_data["wallet_id"],
+                type=TransactionType.EXPENSE,
+                amount=Decimal("1"),
+                description=description,
+                transaction_date=datetime.fromisoformat(when),
+            )
+        )
+    session.commit()
+
+
+@pytest.mark.sqlmodel
+def test_list_transaction_rows_returns_half_open_range_newest_first(sample_data):
+    with get_session() as session:
+        _add_listing_transactions(session, sample_data)
+        rows = list_transaction_rows(session, sample_data["user_id"], *MAY_2024)
+
+    assert [row.description for row in rows] == ["mid month", "at start"]
+    assert rows[0]._fields == (
+        "id",
+        "transaction_date",
+        "type",
+        "amount",
+        "description",
+        "category_id",
+        "wallet_id",
+    )
+    assert rows[0].type == TransactionType.EXPENSE
+    assert rows[0].wallet_id == sample_data["wallet_id"]
+
+
+@pytest.mark.sqlmodel
+def test_list_transactions_loads_category_and_wallet(sample_data):
+    with get_session() as session:
+        _add_listing_transactions(session, sample_data)
+        transactions = list_transactions(session, sample_data["user_id"], *MAY_2024)
+
+    # The session is closed, so these attribute reads only work if the relations were eager-loaded
+    assert [tx.description for tx in transactions] == ["mid month", "at start"]
+    assert {tx.category.name for tx in transactions} == {"Groceries"}
+    assert {tx.wallet.name for tx in transactions} == {"Main"}
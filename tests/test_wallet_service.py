@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.database import get_session
+from app.models import Wallet
+from app.wallet_service import get_primary_wallet
+
+
+@pytest.mark.sqlmodel
+def test_get_primary_wallet_returns_the_primary_wallet(sample_data):
+    with get_session() as session:
+        session.add(Wallet(user_id=sample_data["user_id"], name="Savings", balance=Decimal("5")))
+        session.commit()
+
+        wallet = get_primary_wallet(session, sample_data["user_id"])
+
+    assert wallet is not None
+    assert wallet.id == sample_data["wallet_id"]
+
+
+@pytest.mark.sqlmodel
+def test_get_primary_wallet_without_wallets_returns_none(sample_data):
+    with get_session() as session:
+        assert get_primary_wallet(session, sample_data["user_id"] + 1) is None
+
+
+@pytest.mark.sqlmodel
+def test_second_primary_wallet_is_rejected(sample_data):
+    with get_session() as session:
+        session.add(Wallet(user_id=sample_data["user_id"], name="Another primary", is_primary=True))
+        with pytest.raises(IntegrityError, match="ux_wallet_primary"):
+            session.commit()